@@ -0,0 +1,203 @@
+import argparse
+import json
+import logging
+import os
+import tempfile
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+
+# Benchmarks for the app's database paths (run outside Streamlit).
+# They write synthetic tickets, so point --database-url at a scratch database; the default is a throwaway SQLite file.
+# -------------------------
+STATUSES, STATUS_WEIGHTS = ["Open", "In Progress", "Resolved"], [0.3, 0.2, 0.5]
+PRIORITIES = ["Low", "Medium", "High"]
+WORDS = ("login payment refund invoice password account error crash slow report export email billing upgrade "
+         "subscription access mobile app timeout sync data missing duplicate charge update install").split()
+
+def load_app(database_url):
+# client_query reads CQMS_DATABASE_URL at import time, so set it first
+    os.environ["CQMS_DATABASE_URL"] = database_url
+    import client_query
+    for name in list(logging.root.manager.loggerDict):   # bare-mode "missing ScriptRunContext" noise
+        if name.startswith("streamlit"):
+            logging.getLogger(name).setLevel(logging.ERROR)
+    return client_query
+
+def synthetic_queries(rows, seed=7):
+    rng = np.random.default_rng(seed)
+    submitted = pd.Timestamp("2023-01-01") + pd.to_timedelta(rng.integers(0, 730 * 86400, rows), unit="s")
+    status = rng.choice(STATUSES, rows, p=STATUS_WEIGHTS)
+    resolved = (submitted + pd.to_timedelta(rng.integers(600, 14 * 86400, rows), unit="s")).where(status == "Resolved")
+    text_words = rng.choice(WORDS, (rows, 12))
+    return pd.DataFrame({
+        "client_name": [f"client_{i}" for i in rng.integers(0, max(rows // 200, 10), rows)],
+        "email_id": [f"user{i}@example.com" for i in range(rows)],
+        "mobile_number": rng.integers(6_000_000_000, 9_999_999_999, rows).astype(str),
+        "query_heading": [" ".join(w[:3]) for w in text_words],
+        "query_text": [f"Ticket {i}: " + " ".join(w) for i, w in enumerate(text_words)],
+        "status": status,
+        "priority": rng.choice(PRIORITIES, rows),
+        "submitted_on": submitted.strftime("%Y-%m-%d"),
+        "submitted_time": submitted.strftime("%H:%M:%S"),
+        "resolved_on": resolved.strftime("%Y-%m-%d"),
+        "resolved_time": resolved.strftime("%H:%M:%S"),
+        "assigned_to": np.where(status == "Open", None, "Default Agent"),
+    })
+
+def seed_queries(cq, rows, seed=7):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "queries.csv")
+        synthetic_queries(rows, seed).to_csv(path, index=False)
+        return cq.ingest_queries_csv(path)
+
+def timed(fn, *args, **kwargs):
+    started = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - started, result
+
+# Bulk update vs per-row update
+# -------------------------
+def bench_bulk_update(cq, args):
+    stats = seed_queries(cq, args.rows)
+    print(f"Seeded {stats['rows_inserted']:,} tickets ({stats['rows_per_sec']:,.0f} rows/sec)")
+    ids = cq.get_queries_page(status="Open", limit=2 * args.batch, columns=["query_id"])["query_id"].tolist()
+    per_row_ids, bulk_ids = ids[:args.batch], ids[args.batch:]
+    per_row, _ = timed(lambda: [cq.update_query_status(qid, "In Progress", "bench-agent") for qid in per_row_ids])
+    bulk, updated = timed(cq.bulk_update_queries, "In Progress", "bench-agent", query_ids=bulk_ids)
+    print(f"per-row update_query_status: {len(per_row_ids):,} tickets in {per_row * 1000:,.1f} ms ({len(per_row_ids) / per_row:,.0f} tickets/sec)")
+    print(f"bulk_update_queries:         {len(updated):,} tickets in {bulk * 1000:,.1f} ms ({len(updated) / bulk:,.0f} tickets/sec)")
+    print(f"speed-up: {per_row / bulk * len(updated) / len(per_row_ids):,.1f}x per ticket")
+
+# Concurrent logins
+# -------------------------
+def bench_auth(cq, args):
+    users = [f"bench_user_{i}" for i in range(args.users)]
+    with ThreadPoolExecutor(args.concurrency) as pool:
+        register, _ = timed(lambda: list(pool.map(lambda u: cq.register_user(u, "bench-password"), users)))
+        print(f"registered {len(users):,} users in {register:,.2f}s ({len(users) / register:,.1f}/sec)")
+
+        def login(i):
+            started = time.perf_counter()
+            success, _ = cq.authenticate_user(users[i % len(users)], "bench-password", "client")
+            return success, time.perf_counter() - started
+        elapsed, results = timed(lambda: list(pool.map(login, range(args.logins))))
+    latencies = sorted(seconds for _, seconds in results)
+    failures = sum(not success for success, _ in results)
+    print(f"{args.logins:,} logins, {args.concurrency} concurrent clients, {cq.AUTH_WORKERS} hash workers, "
+          f"{cq.PASSWORD_HASHER} ({cq.PBKDF2_ITERATIONS:,} iterations)")
+    print(f"throughput: {args.logins / elapsed:,.1f} logins/sec, p50 {latencies[len(latencies) // 2] * 1000:,.0f} ms, "
+          f"p95 {latencies[int(len(latencies) * 0.95)] * 1000:,.0f} ms, failures {failures}")
+
+# Latency suite: fetch / filter / aggregate / insert / update at growing table sizes
+# -------------------------
+# The table is grown in place (10k -> 100k -> 1M by default) and every operation runs --repeat times per size
+# with the read cache cleared first, so the numbers are database latency rather than cache hits.
+def suite_operations(cq, rng, ids):
+    pick = lambda: int(rng.choice(ids))
+    ops = {
+        "fetch.first_page": lambda: cq.get_queries_page(),
+        "fetch.deep_page": lambda: cq.get_queries_page(cursor=int(ids[len(ids) // 2])),
+        "fetch.by_id": lambda: cq.get_query_by_id(pick()),
+        "filter.status_priority": lambda: cq.get_queries_page(status="Open", priority="High"),
+        "filter.client": lambda: cq.get_queries_page(client_name=f"client_{rng.integers(0, 10)}"),
+        "filter.date_range": lambda: cq.get_queries_page(date_from="2024-01-01", date_to="2024-01-31"),
+        "aggregate.daily_stats": lambda: cq.get_query_stats(),
+        "aggregate.count_by_status": lambda: cq.get_query_counts("status"),
+        "aggregate.count_by_day": lambda: cq.get_query_counts("submitted_on"),
+        "insert.add_new_query": lambda: cq.add_new_query("client_bench", "bench@example.com", "6000000000", "bench ticket",
+                                                          "Ticket bench: " + " ".join(rng.choice(WORDS, 12)), "Medium"),
+        "update.single": lambda: cq.update_query_status(pick(), str(rng.choice(STATUSES)), "bench-agent"),
+        "update.bulk_100": lambda: cq.bulk_update_queries(str(rng.choice(STATUSES)), "bench-agent", query_ids=[int(i) for i in rng.choice(ids, 100, replace=False)]),
+    }
+    if cq.get_engine().dialect.name == "postgresql":   # the in-process fallback index is rebuilt after every write, which isn't what production runs
+        ops["search.two_terms"] = lambda: cq.search_queries("refund payment")
+    return ops
+
+def run_suite_size(cq, rows, repeat, rng):
+    ids = np.sort(cq.get_queries_page(limit=rows, columns=["query_id"])["query_id"].to_numpy())
+    results = {}
+    for name, op in suite_operations(cq, rng, ids).items():
+        samples = []
+        for _ in range(repeat):
+            cq.get_query_cache().invalidate()
+            samples.append(timed(op)[0] * 1000)
+        results[name] = {"p50_ms": round(float(np.percentile(samples, 50)), 3), "p95_ms": round(float(np.percentile(samples, 95)), 3)}
+    return results
+
+def compare_baseline(report, baseline_path, tolerance):
+# Regressions: operations whose p50 grew by more than `tolerance` against a saved --json report
+    with open(baseline_path) as f:
+        baseline = json.load(f)["sizes"]
+    regressions = []
+    for size, ops in report["sizes"].items():
+        for name, result in ops.items():
+            before = baseline.get(size, {}).get(name)
+            if before and result["p50_ms"] > before["p50_ms"] * (1 + tolerance):
+                regressions.append(f"{name} @ {int(size):,} rows: {before['p50_ms']:,.2f} -> {result['p50_ms']:,.2f} ms")
+    return regressions
+
+def bench_suite(cq, args):
+    if not cq.get_query_counts("status").empty:
+        sys.exit("suite needs an empty queries table: point --database-url at a scratch database")
+    rng = np.random.default_rng(args.seed)
+    report = {"dialect": cq.get_engine().dialect.name, "repeat": args.repeat, "sizes": {}, "ingest": {}}
+    loaded = 0
+    for rows in sorted(args.sizes):
+        stats = seed_queries(cq, rows - loaded, seed=args.seed + rows)
+        loaded += stats["rows_inserted"]
+        report["ingest"][str(rows)] = round(stats["rows_per_sec"])
+        print(f"\n{loaded:,} tickets (ingested {stats['rows_inserted']:,} at {stats['rows_per_sec']:,.0f} rows/sec)")
+        results = report["sizes"][str(rows)] = run_suite_size(cq, loaded, args.repeat, rng)
+        for name, result in results.items():
+            print(f"  {name:<26} p50 {result['p50_ms']:>9,.2f} ms   p95 {result['p95_ms']:>9,.2f} ms")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nwrote {args.json}")
+    if args.baseline:
+        regressions = compare_baseline(report, args.baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+        print(f"no operation slower than baseline by more than {args.tolerance:.0%}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Client Query Management benchmarks")
+    parser.add_argument("--database-url", help="scratch database URL (default: temporary SQLite file)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    bulk = commands.add_parser("bulk-update", help="compare bulk_update_queries() with per-row update_query_status()")
+    bulk.add_argument("--rows", type=int, default=20_000, help="synthetic tickets to seed")
+    bulk.add_argument("--batch", type=int, default=500, help="tickets updated by each path")
+    bulk.set_defaults(func=bench_bulk_update)
+
+    auth = commands.add_parser("auth", help="logins/sec through the bounded password-hashing pool")
+    auth.add_argument("--users", type=int, default=20)
+    auth.add_argument("--logins", type=int, default=200)
+    auth.add_argument("--concurrency", type=int, default=16, help="simultaneous login attempts")
+    auth.add_argument("--workers", type=int, help="hash worker threads (CQMS_AUTH_WORKERS)")
+    auth.add_argument("--iterations", type=int, help="PBKDF2 iterations (CQMS_PBKDF2_ITERATIONS)")
+    auth.set_defaults(func=bench_auth)
+
+    suite = commands.add_parser("suite", help="fetch/filter/aggregate/insert/update latency at growing table sizes")
+    suite.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000], help="table sizes to measure at")
+    suite.add_argument("--repeat", type=int, default=20, help="runs per operation and size (p50/p95 reported)")
+    suite.add_argument("--seed", type=int, default=7)
+    suite.add_argument("--json", help="write the results here (use as a later --baseline)")
+    suite.add_argument("--baseline", help="fail (exit 1) if any p50 regressed against this --json report")
+    suite.add_argument("--tolerance", type=float, default=0.25, help="allowed p50 slowdown vs the baseline")
+    suite.set_defaults(func=bench_suite)
+
+    args = parser.parse_args(argv)
+    for option, variable in (("workers", "CQMS_AUTH_WORKERS"), ("iterations", "CQMS_PBKDF2_ITERATIONS")):
+        if getattr(args, option, None):
+            os.environ[variable] = str(getattr(args, option))
+    with tempfile.TemporaryDirectory() as tmp:
+        args.func(load_app(args.database_url or f"sqlite:///{os.path.join(tmp, 'bench.db')}"), args)
+
+if __name__ == "__main__":
+    main()
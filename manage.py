@@ -0,0 +1,78 @@
+import argparse
+import os
+from client_query import (EXPORT_CHUNK_SIZE, EXPORT_FORMATS, SEED_CSV_URL, create_db_engine, dedupe_queries, export_queries,
+                          ingest_queries_csv, rebuild_query_stats, seed_database, setup_database)
+
+# Maintenance commands (run outside Streamlit)
+# -------------------------
+def print_ingest_stats(stats):
+    print(f"📥 Read {stats['rows_read']:,} rows, inserted {stats['rows_inserted']:,} new queries "
+          f"in {stats['seconds']:.2f}s ({stats['rows_per_sec']:,.0f} rows/sec)")
+
+def cmd_migrate(args):
+    applied = setup_database(create_db_engine())
+    print(f"🗂 Applied migrations: {applied}" if applied else "🗂 Schema is up to date.")
+
+def cmd_dedupe(args):
+    removed = dedupe_queries(create_db_engine(), dry_run=args.dry_run)
+    if removed.empty:
+        return print("🧹 No duplicate tickets found.")
+    print(removed.to_string(index=False))
+    print(f"🧹 {'Would remove' if args.dry_run else 'Removed'} {len(removed):,} duplicate tickets (the most-progressed copy of each is kept).")
+
+def cmd_seed(args):
+    stats = seed_database(SEED_CSV_URL if args.with_sample_queries else args.csv)
+    print("👤 Default users ensured.")
+    if stats: print_ingest_stats(stats)
+
+def cmd_ingest(args):
+    print_ingest_stats(ingest_queries_csv(args.source, chunksize=args.chunksize))
+
+def cmd_rebuild_stats(args):
+    print(f"📊 Rebuilt query_daily_stats ({rebuild_query_stats():,} aggregate rows).")
+
+def cmd_export(args):
+    fmt = args.format or os.path.splitext(args.output)[1].lstrip(".").lower() or "csv"
+    stats = export_queries(args.output, fmt, chunk_size=args.chunk_size, client_name=args.client, status=args.status,
+                           priority=args.priority, date_from=args.date_from, date_to=args.date_to)
+    peak = f", peak RSS {stats['peak_rss_mb']:,.0f} MB" if stats["peak_rss_mb"] is not None else ""
+    print(f"📤 Exported {stats['rows']:,} queries to {args.output} in {stats['seconds']:.2f}s ({stats['rows_per_sec']:,.0f} rows/sec{peak})")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Client Query Management maintenance commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("migrate", help="apply pending schema migrations").set_defaults(func=cmd_migrate)
+
+    dedupe = commands.add_parser("dedupe", help="remove tickets that duplicate another ticket's natural key (needed before migration 5)")
+    dedupe.add_argument("--dry-run", action="store_true", help="list the tickets that would be removed without deleting them")
+    dedupe.set_defaults(func=cmd_dedupe)
+
+    seed = commands.add_parser("seed", help="create the default users and optionally load sample queries")
+    seed.add_argument("--csv", help="also ingest queries from this CSV path or URL")
+    seed.add_argument("--with-sample-queries", action="store_true", help="also ingest the sample dataset")
+    seed.set_defaults(func=cmd_seed)
+
+    ingest = commands.add_parser("ingest", help="bulk-load queries from a CSV file or URL (idempotent)")
+    ingest.add_argument("source", nargs="?", default=SEED_CSV_URL, help="CSV path or URL (default: sample dataset)")
+    ingest.add_argument("--chunksize", type=int, default=50_000, help="rows per COPY/insert batch")
+    ingest.set_defaults(func=cmd_ingest)
+
+    commands.add_parser("rebuild-stats", help="recompute dashboard aggregates from the queries table").set_defaults(func=cmd_rebuild_stats)
+
+    export = commands.add_parser("export", help="stream filtered queries to CSV or Parquet")
+    export.add_argument("output", help="destination file (.csv or .parquet)")
+    export.add_argument("--format", choices=EXPORT_FORMATS, help="default: from the file extension")
+    export.add_argument("--status", choices=["Open", "In Progress", "Resolved"])
+    export.add_argument("--priority", choices=["Low", "Medium", "High"])
+    export.add_argument("--client", help="client_name to export")
+    export.add_argument("--from", dest="date_from", help="submitted on or after (YYYY-MM-DD)")
+    export.add_argument("--to", dest="date_to", help="submitted on or before (YYYY-MM-DD)")
+    export.add_argument("--chunk-size", type=int, default=EXPORT_CHUNK_SIZE, help="rows fetched and written per chunk")
+    export.set_defaults(func=cmd_export)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
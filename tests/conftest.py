@@ -0,0 +1,24 @@
+import logging
+import os
+import sys
+import tempfile
+import pytest
+from sqlalchemy import text
+
+# client_query reads CQMS_DATABASE_URL at import time: run every test against a throwaway SQLite file
+os.environ["CQMS_DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='cqms-tests-'), 'test.db')}"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import client_query
+
+for name in list(logging.root.manager.loggerDict):   # bare-mode "missing ScriptRunContext" noise
+    if name.startswith("streamlit"):
+        logging.getLogger(name).setLevel(logging.ERROR)
+
+@pytest.fixture
+def cq():
+# Migrated database with empty ticket tables and a cold read cache
+    with client_query.get_engine().begin() as conn:
+        for table in ("queries", "query_daily_stats"):
+            conn.execute(text(f"DELETE FROM {table};"))
+    client_query.get_query_cache().invalidate()
+    return client_query
@@ -0,0 +1,48 @@
+import pytest
+from sqlalchemy import text
+
+INSERT = text("""INSERT INTO queries (client_name, query_text, status, priority, submitted_on, submitted_time, resolved_on, resolved_time, assigned_to)
+    VALUES (:client_name, :query_text, :status, 'High', '2024-03-01', '09:00:00', :resolved_on, :resolved_time, :assigned_to);""")
+
+@pytest.fixture
+def legacy_engine(cq, tmp_path, monkeypatch):
+# A database migrated before the natural key became unique, holding duplicate tickets
+    engine = cq.create_db_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    monkeypatch.setattr(cq, "MIGRATIONS", cq.MIGRATIONS[:4])
+    cq.setup_database(engine)
+    monkeypatch.undo()
+    tickets = [
+        ("acme", "VPN drops", "Open", None, None, None),
+        ("acme", "VPN drops", "Resolved", "2024-03-02", "10:00:00", "Agent A"),   # worked copy: kept
+        ("acme", "VPN drops", "In Progress", None, None, "Agent B"),
+        ("globex", "Refund", "Open", None, None, None),                          # lowest id of an untouched pair: kept
+        ("globex", "Refund", "Open", None, None, None),
+        ("initech", "Billing", "Open", None, None, None),
+    ]
+    with engine.begin() as conn:
+        for client, body, status, resolved_on, resolved_time, agent in tickets:
+            conn.execute(INSERT, {"client_name": client, "query_text": body, "status": status, "resolved_on": resolved_on,
+                                  "resolved_time": resolved_time, "assigned_to": agent})
+        cq._rebuild_query_stats(conn)
+    return engine
+
+def remaining(engine):
+    with engine.connect() as conn:
+        return conn.execute(text("SELECT query_id, client_name, status FROM queries ORDER BY query_id;")).all()
+
+def test_migration_refuses_duplicates(cq, legacy_engine):
+    with pytest.raises(RuntimeError, match="manage.py dedupe"):
+        cq.setup_database(legacy_engine)
+    assert len(remaining(legacy_engine)) == 6
+
+def test_dry_run_deletes_nothing(cq, legacy_engine):
+    assert cq.dedupe_queries(legacy_engine, dry_run=True)["query_id"].tolist() == [1, 3, 5]
+    assert len(remaining(legacy_engine)) == 6
+
+def test_dedupe_keeps_most_progressed_copy(cq, legacy_engine):
+    assert cq.dedupe_queries(legacy_engine)["query_id"].tolist() == [1, 3, 5]
+    assert remaining(legacy_engine) == [(2, "acme", "Resolved"), (4, "globex", "Open"), (6, "initech", "Open")]
+    with legacy_engine.connect() as conn:
+        assert conn.execute(text("SELECT SUM(query_count), SUM(resolved_count) FROM query_daily_stats;")).one() == (3, 1)
+    assert cq.setup_database(legacy_engine) == [5]
+    assert cq.dedupe_queries(legacy_engine).empty
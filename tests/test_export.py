@@ -0,0 +1,70 @@
+import os
+import time
+import pandas as pd
+import pytest
+
+TICKETS = pd.DataFrame({
+    "client_name": ["acme", "globex", "initech"],
+    "email_id": ["a@acme.com", None, "c@initech.com"],
+    "mobile_number": ["6000000001", "6000000002", None],
+    "query_heading": ["Login", "Refund", "Billing"],
+    "query_text": ["Cannot log in", "Refund pending", "Charged twice"],
+    "status": ["Open", "Resolved", "In Progress"],
+    "priority": ["High", "Low", "Medium"],
+    "submitted_on": ["2024-03-01", "2024-03-02", "2024-03-03"],
+    "submitted_time": ["09:00:00", "10:30:00", "11:00:00"],
+    "resolved_on": [None, "2024-03-04", None],
+    "resolved_time": [None, "09:15:00", None],
+    "assigned_to": [None, "Agent A", "Agent B"],
+})
+
+@pytest.fixture
+def exported(cq, tmp_path):
+    source = tmp_path / "tickets.csv"
+    TICKETS.to_csv(source, index=False)
+    cq.ingest_queries_csv(str(source))
+    def export(fmt, **filters):
+        out = tmp_path / f"export.{fmt}"
+        stats = cq.export_queries(str(out), fmt, chunk_size=2, **filters)
+        df = pd.read_csv(out, dtype=str) if fmt == "csv" else pd.read_parquet(out)
+        return stats, df
+    return export
+
+def as_text(df):
+# Compare both formats as text with missing values as None
+    return df.astype(object).map(lambda v: None if pd.isna(v) else str(v))
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet"])
+def test_export_round_trips(exported, fmt):
+    stats, df = exported(fmt)
+    assert stats["rows"] == len(TICKETS) == len(df)
+    assert df["query_id"].is_monotonic_increasing
+    assert as_text(df)[list(TICKETS.columns)].values.tolist() == as_text(TICKETS).values.tolist()
+
+def test_parquet_keeps_nulls(exported):
+    _, df = exported("parquet")
+    open_ticket = df[df["status"] == "Open"].iloc[0]
+    assert pd.isna(open_ticket["assigned_to"]) and pd.isna(open_ticket["resolved_time"]) and pd.isna(open_ticket["resolved_on"])
+    assert not df.isin(["nan", "None"]).any().any()
+
+def test_csv_and_parquet_agree(exported):
+    _, csv_df = exported("csv")
+    _, parquet_df = exported("parquet")
+    assert as_text(csv_df).values.tolist() == as_text(parquet_df).values.tolist()
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet"])
+def test_filtered_and_empty_exports(exported, fmt):
+    stats, df = exported(fmt, status="Resolved")
+    assert stats["rows"] == 1 and df["client_name"].tolist() == ["globex"]
+    stats, df = exported(fmt, client_name="nobody")
+    assert stats["rows"] == 0 and df.empty and "query_id" in df.columns
+
+def test_sweep_removes_only_stale_exports(cq):
+    export_dir = cq.get_export_dir().name
+    stale, fresh = os.path.join(export_dir, "queries_stale.csv"), os.path.join(export_dir, "queries_fresh.csv")
+    for path in (stale, fresh):
+        open(path, "w").close()
+    os.utime(stale, (time.time() - 7200, time.time() - 7200))
+    cq.sweep_exports(max_age=3600)
+    assert not os.path.exists(stale) and os.path.exists(fresh)
+    os.remove(fresh)
@@ -0,0 +1,66 @@
+import pandas as pd
+import pytest
+from sqlalchemy import text
+
+CSV_ROWS = pd.DataFrame({
+    "client_name": ["acme", "acme", "globex", "globex", "initech"],
+    "email_id": ["a@acme.com", "b@acme.com", "c@globex.com", "d@globex.com", "e@initech.com"],
+    "mobile_number": ["6000000001", "6000000002", "6000000003", "6000000004", "6000000005"],
+    "query_heading": ["Login", "Refund", "Export", "Crash", "Billing"],
+    "query_text": ["Cannot log in", "Refund pending", "Export times out", "App crashes", "Charged twice"],
+    "status": ["Open", "Resolved", "Resolved", "In Progress", "Resolved"],
+    "priority": ["High", "Low", "Medium", "High", "Low"],
+    "submitted_on": ["2024-03-01", "2024-03-01", "2024-03-02", "2024-03-02", "2024-03-03"],
+    "submitted_time": ["09:00:00", "10:30:00", "11:00:00", "12:15:00", "08:45:00"],
+    "resolved_on": [None, "2024-03-02", "2024-03-02", None, "2024-03-05"],
+    "resolved_time": [None, "09:00:00", "17:30:00", None, None],
+    "assigned_to": [None, "Agent A", "Agent B", "Agent B", "Agent A"],
+})
+
+def daily_stats(cq):
+    with cq.get_engine().connect() as conn:
+        df = pd.read_sql(text("SELECT * FROM query_daily_stats WHERE query_count <> 0 ORDER BY day, status, priority;"), conn)
+    return df.astype({"day": str})
+
+def assert_matches_rebuild(cq):
+# Incrementally maintained aggregates must equal a from-scratch recomputation
+    incremental = daily_stats(cq)
+    cq.rebuild_query_stats()
+    rebuilt = daily_stats(cq)
+    pd.testing.assert_frame_equal(incremental.drop(columns="resolution_seconds"), rebuilt.drop(columns="resolution_seconds"))
+    assert incremental["resolution_seconds"].tolist() == pytest.approx(rebuilt["resolution_seconds"].tolist(), abs=0.01)
+
+@pytest.fixture
+def ingested(cq, tmp_path):
+    path = tmp_path / "queries.csv"
+    CSV_ROWS.to_csv(path, index=False)
+    assert cq.ingest_queries_csv(str(path))["rows_inserted"] == len(CSV_ROWS)
+    return path
+
+def ids(cq, **filters):
+    return cq.get_queries_page(columns=["query_id"], **filters)["query_id"].tolist()
+
+def test_ingest_matches_rebuild(cq, ingested):
+    assert_matches_rebuild(cq)
+
+def test_reingest_does_not_double_count(cq, ingested):
+    before = daily_stats(cq)
+    assert cq.ingest_queries_csv(str(ingested))["rows_inserted"] == 0
+    pd.testing.assert_frame_equal(daily_stats(cq), before)
+    assert_matches_rebuild(cq)
+
+def test_add_new_query_matches_rebuild(cq, ingested):
+    cq.add_new_query("acme", "a@acme.com", "6000000001", "VPN", "VPN drops every hour", "Medium")
+    assert_matches_rebuild(cq)
+
+def test_status_updates_match_rebuild(cq, ingested):
+    open_id, = ids(cq, status="Open")
+    reopened = ids(cq, status="Resolved")[0]
+    cq.update_query_status(open_id, "Resolved", "Agent C")
+    cq.update_query_status(reopened, "Open", "Agent C")
+    assert_matches_rebuild(cq)
+
+def test_bulk_updates_match_rebuild(cq, ingested):
+    cq.bulk_update_queries("Resolved", "Agent D", query_ids=ids(cq, client_name="globex"))
+    cq.bulk_update_queries("In Progress", filters={"status": "Resolved", "priority": "Low"})
+    assert_matches_rebuild(cq)
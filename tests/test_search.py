@@ -0,0 +1,44 @@
+import pytest
+
+@pytest.fixture
+def tickets(cq):
+    def add(heading, body):
+        cq.add_new_query("client_a", "a@example.com", "6000000000", heading, body, "Medium")
+        return int(cq.get_queries_page(limit=1, columns=["query_id"])["query_id"].iloc[0])
+    return add
+
+def test_heading_match_outranks_description_match(cq, tickets):
+    in_text = tickets("Cannot log in", "The refund never arrived")
+    in_heading = tickets("Refund missing", "Charged twice last week")
+    results, _ = cq.search_queries("refund")
+    assert results["query_id"].tolist() == [in_heading, in_text]
+    assert results["rank"].is_monotonic_decreasing
+
+def test_every_term_must_match(cq, tickets):
+    both = tickets("Payment failed", "Card declined, please refund")
+    tickets("Payment failed", "Card declined twice")
+    tickets("Refund request", "Order cancelled")
+    results, _ = cq.search_queries("payment refund")
+    assert results["query_id"].tolist() == [both]
+    assert cq.search_queries("payment unknownword")[0].empty
+
+def test_paging_and_has_more(cq, tickets):
+    ids = [tickets(f"Export issue {i}", "The export times out") for i in range(5)]
+    first, more = cq.search_queries("export", page=0, page_size=2)
+    last, no_more = cq.search_queries("export", page=2, page_size=2)
+    assert len(first) == 2 and more
+    assert len(last) == 1 and not no_more
+    pages = [cq.search_queries("export", page=p, page_size=2)[0]["query_id"].tolist() for p in range(3)]
+    assert sorted(sum(pages, [])) == sorted(ids)
+
+def test_snippet_bolds_matches(cq, tickets):
+    tickets("Login", "After the upgrade the Mobile app crashes on launch")
+    results, _ = cq.search_queries("mobile crashes")
+    assert "**Mobile**" in results["snippet"].iloc[0]
+    assert "**crashes**" in results["snippet"].iloc[0]
+    assert "**app**" not in results["snippet"].iloc[0]
+
+def test_new_ticket_is_searchable(cq, tickets):
+    assert cq.search_queries("invoice")[0].empty
+    new_id = tickets("Invoice wrong", "Wrong VAT on the invoice")
+    assert cq.search_queries("invoice")[0]["query_id"].tolist() == [new_id]